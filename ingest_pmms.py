@@ -1,11 +1,16 @@
 import requests
+import collections
+import configparser
 import csv
+import io
+import itertools
 import sqlite3
 import logging
 from datetime import datetime
 import os
 import gzip
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Load configuration
@@ -17,6 +22,8 @@ def load_config():
     config = {
         'DB_NAME': "pmms_data.db",
         'TABLE_NAME': "pmms_rates",
+        'JOURNAL_MODE': "WAL",
+        'SYNCHRONOUS': "NORMAL",
         'CSV_URL': "https://www.freddiemac.com/pmms/docs/PMMS_history.csv",
         'HTTP_PROXY': None,
         'HTTPS_PROXY': None,
@@ -33,36 +40,46 @@ def load_config():
     
     # Load from file if exists
     if config_file.exists():
+        # The file is flat KEY = value pairs; configparser wants a section
+        # header, so one is prepended. Its C-assisted parser replaces the
+        # old hand-rolled per-line strip/split loop.
+        parser = configparser.ConfigParser(inline_comment_prefixes=('#',),
+                                           interpolation=None)
+        parser.optionxform = str  # keep keys uppercase as written
         with open(config_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove inline comments
-                    if '#' in value:
-                        value = value.split('#')[0].strip()
-                    
-                    # Handle different data types
-                    if key in ['LOG_MAX_BYTES', 'REQUEST_TIMEOUT', 'PROGRESS_LOG_INTERVAL', 'LOG_BACKUP_COUNT']:
-                        config[key] = int(value)
-                    elif key == 'LOG_LEVEL':
-                        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-                        level = value.strip('"\'').upper()
-                        if level not in valid_levels:
-                            raise ValueError(f"Invalid LOG_LEVEL '{value}'. Must be one of: {valid_levels}")
-                        config[key] = level
-                    elif key in ['LOG_COMPRESS_BACKUPS']:
-                        config[key] = value.lower() in ('true', '1', 'yes', 'on')
-                    elif key in ['HTTP_PROXY', 'HTTPS_PROXY']:
-                        config[key] = value.strip('"\'') if value else None
-                    elif key in ['PROXY_USERNAME', 'PROXY_PASSWORD']:
-                        config[key] = value.strip('"\'') if value else ""
-                    else:
-                        config[key] = value.strip('"\'')
-    
+            parser.read_string('[DEFAULT]\n' + f.read())
+
+        for key, raw_value in parser.defaults().items():
+            value = raw_value.strip().strip('"\'')
+
+            # Handle different data types
+            if key in ['LOG_MAX_BYTES', 'REQUEST_TIMEOUT', 'PROGRESS_LOG_INTERVAL', 'LOG_BACKUP_COUNT']:
+                config[key] = int(value)
+            elif key == 'LOG_LEVEL':
+                valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+                level = value.upper()
+                if level not in valid_levels:
+                    raise ValueError(f"Invalid LOG_LEVEL '{value}'. Must be one of: {valid_levels}")
+                config[key] = level
+            elif key == 'JOURNAL_MODE':
+                valid_modes = ['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF']
+                mode = value.upper()
+                if mode not in valid_modes:
+                    raise ValueError(f"Invalid JOURNAL_MODE '{value}'. Must be one of: {valid_modes}")
+                config[key] = mode
+            elif key == 'SYNCHRONOUS':
+                valid_sync = ['OFF', 'NORMAL', 'FULL', 'EXTRA']
+                sync = value.upper()
+                if sync not in valid_sync:
+                    raise ValueError(f"Invalid SYNCHRONOUS '{value}'. Must be one of: {valid_sync}")
+                config[key] = sync
+            elif key == 'LOG_COMPRESS_BACKUPS':
+                config[key] = value.lower() in ('true', '1', 'yes', 'on')
+            elif key in ['HTTP_PROXY', 'HTTPS_PROXY']:
+                config[key] = value or None
+            else:
+                config[key] = value
+
     return config
 
 # Load configuration
@@ -98,6 +115,63 @@ def get_auth():
         return (CONFIG['PROXY_USERNAME'], CONFIG['PROXY_PASSWORD'])
     return None
 
+# Shared HTTP session so proxies/auth are configured once and, when the
+# module is imported and run repeatedly in one process, the pooled
+# connection and TLS handshake are reused across runs
+SESSION = None
+
+def get_session():
+    """Returns the shared requests.Session, configuring it on first use."""
+    global SESSION
+    if SESSION is None:
+        SESSION = requests.Session()
+        SESSION.headers['Accept-Encoding'] = 'gzip'
+        SESSION.proxies.update(get_proxies())
+        auth = get_auth()
+        if auth:
+            SESSION.auth = auth
+    return SESSION
+
+# Sidecar file holding the Last-Modified/ETag validators from the last
+# successful run, so unchanged CSVs can be skipped with a 304 response
+HTTP_CACHE_FILE = f"{DB_NAME}.etag"
+
+def load_cached_validators():
+    """Returns conditional-GET headers from the previous successful run."""
+    headers = {}
+    cache_file = Path(HTTP_CACHE_FILE)
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'r') as f:
+                for line in f:
+                    if '=' in line:
+                        key, value = line.strip().split('=', 1)
+                        if key == 'last_modified' and value:
+                            headers['If-Modified-Since'] = value
+                        elif key == 'etag' and value:
+                            headers['If-None-Match'] = value
+        except OSError as e:
+            logger.warning(f"Could not read HTTP cache file {HTTP_CACHE_FILE}: {e}")
+    return headers
+
+def save_cached_validators(response_headers):
+    """Persists Last-Modified/ETag from a successful 200 response."""
+    last_modified = response_headers.get('Last-Modified', '')
+    etag = response_headers.get('ETag', '')
+    if not last_modified and not etag:
+        return
+    try:
+        with open(HTTP_CACHE_FILE, 'w') as f:
+            f.write(f"last_modified={last_modified}\n")
+            f.write(f"etag={etag}\n")
+    except OSError as e:
+        logger.warning(f"Could not write HTTP cache file {HTTP_CACHE_FILE}: {e}")
+
+# Single worker that gzips rotated log backups off the logging thread, so a
+# rollover triggered mid-ingest never stalls on CPU-bound compression. One
+# worker also serializes jobs from consecutive rollovers.
+LOG_COMPRESS_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
 # Configure logging with rotation
 def setup_logging():
     """Setup logging with rotation and proper formatting."""
@@ -119,34 +193,51 @@ def setup_logging():
         from logging.handlers import RotatingFileHandler
         
         class CompressedRotatingFileHandler(RotatingFileHandler):
+            _compress_future = None
+
+            @staticmethod
+            def _compress_file(src):
+                """Gzips src to src.gz and removes the original."""
+                with open(src, 'rb') as f_in:
+                    with gzip.open(f"{src}.gz", 'wb') as f_out:
+                        shutil.copyfileobj(f_in, f_out)
+                os.remove(src)
+
             def doRollover(self):
-                """Do a rollover with compression of backup files."""
+                """Do a rollover, compressing backups on a background thread."""
                 if self.stream:
                     self.stream.close()
                     self.stream = None
-                
-                # Compress existing backup files
+
+                # Make sure the previous rollover's compression has finished
+                # before shuffling files around (it normally finished long
+                # ago - one rollover's worth of logging earlier)
+                if self._compress_future is not None:
+                    self._compress_future.result()
+                    self._compress_future = None
+
+                # Shift existing backups up one slot (renames only)
                 for i in range(self.backupCount - 1, 0, -1):
-                    src = f"{self.baseFilename}.{i}"
-                    dst = f"{self.baseFilename}.{i + 1}"
-                    
-                    if os.path.exists(src):
-                        if os.path.exists(dst):
-                            os.remove(dst)
-                        
-                        # Compress the file
-                        with open(src, 'rb') as f_in:
-                            with gzip.open(f"{dst}.gz", 'wb') as f_out:
-                                shutil.copyfileobj(f_in, f_out)
-                        os.remove(src)
-                
-                # Move current file to .1
+                    for ext in ('.gz', ''):
+                        src = f"{self.baseFilename}.{i}{ext}"
+                        dst = f"{self.baseFilename}.{i + 1}{ext}"
+
+                        if os.path.exists(src):
+                            if os.path.exists(dst):
+                                os.remove(dst)
+                            os.rename(src, dst)
+
+                # Move current file to .1 and queue its compression off the
+                # logging thread; in-process gzip of a large log would stall
+                # whatever log call triggered this rollover
                 if os.path.exists(self.baseFilename):
                     dst = f"{self.baseFilename}.1"
                     if os.path.exists(dst):
                         os.remove(dst)
                     self.rotate(self.baseFilename, dst)
-                
+                    self._compress_future = LOG_COMPRESS_EXECUTOR.submit(
+                        self._compress_file, dst)
+
                 # Create new file
                 if not self.delay:
                     self.stream = self._open()
@@ -185,7 +276,21 @@ def get_db_connection():
     """Creates and returns a connection to the SQLite database."""
     try:
         logger.info(f"Connecting to database: {DB_NAME}")
-        conn = sqlite3.connect(DB_NAME)
+        # isolation_level=None disables the driver's implicit transaction
+        # management; the ingest path drives BEGIN IMMEDIATE/COMMIT itself.
+        # A larger statement cache keeps the batch INSERTs parsed once.
+        conn = sqlite3.connect(DB_NAME, isolation_level=None,
+                               cached_statements=512)
+        # Tune the connection for ingest workloads. WAL + synchronous=NORMAL
+        # avoids the double fsync per commit of the default rollback journal;
+        # synchronous=OFF trades durability for speed and must be opted into
+        # via the config file.
+        if CONFIG['SYNCHRONOUS'] == 'OFF':
+            logger.warning("SYNCHRONOUS=OFF configured - commits are not durable against power loss")
+        conn.execute(f"PRAGMA journal_mode={CONFIG['JOURNAL_MODE']}")
+        conn.execute(f"PRAGMA synchronous={CONFIG['SYNCHRONOUS']}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64MB page cache
         # Create table if it doesn't exist
         conn.execute(f'''
             CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
@@ -200,78 +305,146 @@ def get_db_connection():
         logger.error(f"Database connection failed: {e}")
         raise
 
+# Rows inserted per multi-row VALUES statement. 100 rows x 3 columns stays
+# well under SQLite's bind-variable limit (999 on older builds).
+INSERT_BATCH_SIZE = 100
+
+# Module-level SQL constants so the connection's statement cache always hits
+# the same string instead of re-parsing a freshly built f-string per call.
+# The UPSERT spelling dedupes on the date PRIMARY KEY at C speed and is the
+# standard-SQL successor to INSERT OR IGNORE (SQLite 3.24+).
+BATCH_PLACEHOLDERS = ','.join(['(?, ?, ?)'] * INSERT_BATCH_SIZE)
+INSERT_SQL_PREFIX = f"INSERT INTO {TABLE_NAME} (date, pmms30, pmms15) VALUES "
+INSERT_SQL_SUFFIX = " ON CONFLICT(date) DO NOTHING"
+INSERT_BATCH_SQL = INSERT_SQL_PREFIX + BATCH_PLACEHOLDERS + INSERT_SQL_SUFFIX
+
+# Unindexed staging table used for bulk loads into an empty database; it has
+# no unique constraint, so its inserts take no conflict clause
+STAGING_SQL_PREFIX = "INSERT INTO staging (date, pmms30, pmms15) VALUES "
+
+def insert_records(cursor, dates, pmms30s, pmms15s,
+                   sql_prefix=INSERT_SQL_PREFIX, sql_suffix=INSERT_SQL_SUFFIX):
+    """Inserts records held in parallel column lists using multi-row VALUES
+    statements of INSERT_BATCH_SIZE rows each, so statement dispatch cost is
+    paid once per batch instead of once per row."""
+    batch_sql = (INSERT_BATCH_SQL if sql_prefix == INSERT_SQL_PREFIX
+                 else sql_prefix + BATCH_PLACEHOLDERS + sql_suffix)
+    for start in range(0, len(dates), INSERT_BATCH_SIZE):
+        stop = start + INSERT_BATCH_SIZE
+        chunk_dates = dates[start:stop]
+        params = list(itertools.chain.from_iterable(
+            zip(chunk_dates, pmms30s[start:stop], pmms15s[start:stop])))
+
+        if len(chunk_dates) == INSERT_BATCH_SIZE:
+            cursor.execute(batch_sql, params)
+        else:
+            # Remainder batch needs its own statement sized to the tail
+            tail_sql = (sql_prefix + ','.join(['(?, ?, ?)'] * len(chunk_dates))
+                        + sql_suffix)
+            cursor.execute(tail_sql, params)
+
 def get_latest_date_from_db(conn):
     """Queries the DB to find the most recent date stored."""
     try:
         logger.info("Querying latest date from database")
         cursor = conn.cursor()
-        cursor.execute(f"SELECT MAX(date) FROM {TABLE_NAME}")
+        # date is the PRIMARY KEY, so this is a single B-tree end scan;
+        # cheaper than MAX() aggregation on some SQLite versions
+        cursor.execute(f"SELECT date FROM {TABLE_NAME} ORDER BY date DESC LIMIT 1")
         result = cursor.fetchone()
-        latest_date = result[0] if result[0] else None
+        latest_date = result[0] if result else None
         logger.info(f"Latest date in database: {latest_date}")
         return latest_date
     except sqlite3.Error as e:
         logger.error(f"Failed to query latest date from database: {e}")
         raise
 
-def parse_row(row):
+# Per-run counters for rows and values rejected during parsing. Rejections
+# are tallied and logged as one summary line after streaming, since per-row
+# warning formatting is measurable when the feed contains many bad rows.
+PARSE_REJECT_COUNTS = collections.Counter()
+
+def parse_rate(value, field):
+    """Converts a rate cell to float, tallying rejects instead of logging."""
+    if not value:
+        return None
+    # Cheap first-character check keeps obviously bad values from paying
+    # for a raised ValueError
+    if value[0] in '0123456789-.':
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    PARSE_REJECT_COUNTS[f'invalid_{field}'] += 1
+    return None
+
+def parse_row(values, date_i, pmms30_i, pmms15_i):
     """
-    Parses a CSV row dictionary into a clean format.
-    Adjust column keys based on the actual CSV header names.
+    Parses a CSV row (list of values from csv.reader) into a
+    (date, pmms30, pmms15) tuple, or None if the row is unusable.
+    Column positions are discovered once from the header by the caller.
     """
     try:
-        # Normalize keys to lowercase to handle header variations
-        row = {k.strip().lower(): v for k, v in row.items()}
-        
         # Check if date field exists
-        if 'date' not in row:
-            logger.warning(f"Row missing 'date' field: {row}")
+        if date_i is None or date_i >= len(values):
+            PARSE_REJECT_COUNTS['missing_date'] += 1
             return None
-        
-        date_value = row['date'].strip()
+
+        date_value = values[date_i].strip()
         if not date_value:
-            logger.warning(f"Empty date value in row: {row}")
+            PARSE_REJECT_COUNTS['empty_date'] += 1
             return None
-        
-        try:
-            # Freddie Mac CSV dates are usually M/D/YYYY
-            dt_obj = datetime.strptime(date_value, "%Y-%m-%d")
-        except ValueError:
-            try:
-                dt_obj = datetime.strptime(date_value, "%m/%d/%Y")
-            except ValueError as e:
-                logger.warning(f"Failed to parse date '{date_value}': {e}")
-                return None
 
-        # Format date as YYYY-MM-DD for SQLite sorting
-        formatted_date = dt_obj.strftime("%Y-%m-%d")
-        
-        # Extract rate values with fallbacks
-        pmms30 = row.get('pmms30', None) or row.get('30-yr frm', None)
-        pmms15 = row.get('pmms15', None) or row.get('15-yr frm', None)
-        
-        # Validate rate values
-        if pmms30 is not None:
-            try:
-                pmms30 = float(pmms30)
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid pmms30 value '{pmms30}' in row: {row}")
-                pmms30 = None
-                
-        if pmms15 is not None:
-            try:
-                pmms15 = float(pmms15)
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid pmms15 value '{pmms15}' in row: {row}")
-                pmms15 = None
-        
-        return {
-            "date": formatted_date,
-            "pmms30": pmms30,
-            "pmms15": pmms15
-        }
+        # Fast path: ISO YYYY-MM-DD is already in storage format, so the
+        # strptime/strftime round trip (and its datetime allocation) can be
+        # skipped entirely. Freddie Mac CSV dates are otherwise M/D/YYYY.
+        if (len(date_value) == 10 and date_value[4] == '-' and date_value[7] == '-'
+                and date_value[:4].isdigit() and date_value[5:7].isdigit()
+                and date_value[8:10].isdigit()):
+            formatted_date = date_value
+        else:
+            # Manual M/D/YYYY split: strptime builds a full datetime through
+            # interpreted format-string machinery, which profiles an order of
+            # magnitude slower than slicing and int() on this fixed layout
+            formatted_date = None
+            parts = date_value.split('/')
+            if len(parts) == 3:
+                month, day, year = parts
+                if (month.isdigit() and day.isdigit()
+                        and len(year) == 4 and year.isdigit()):
+                    try:
+                        # The datetime constructor rejects calendar-invalid
+                        # combinations like 2/31 while staying far cheaper
+                        # than strptime's format-string machinery
+                        datetime(int(year), int(month), int(day))
+                        formatted_date = f"{year}-{int(month):02d}-{int(day):02d}"
+                    except ValueError:
+                        pass
+
+            if formatted_date is None:
+                # Last resort for anything unexpected; keeps odd-but-valid
+                # inputs working at strptime speed
+                try:
+                    dt_obj = datetime.strptime(date_value, "%m/%d/%Y")
+                except ValueError:
+                    try:
+                        dt_obj = datetime.strptime(date_value, "%Y-%m-%d")
+                    except ValueError:
+                        PARSE_REJECT_COUNTS['unparseable_date'] += 1
+                        return None
+
+                # Format date as YYYY-MM-DD for SQLite sorting
+                formatted_date = dt_obj.strftime("%Y-%m-%d")
+
+        # Extract rate values by position, treating blanks as missing
+        pmms30 = parse_rate(values[pmms30_i].strip(), 'pmms30') \
+            if pmms30_i is not None and pmms30_i < len(values) else None
+        pmms15 = parse_rate(values[pmms15_i].strip(), 'pmms15') \
+            if pmms15_i is not None and pmms15_i < len(values) else None
+
+        return (formatted_date, pmms30, pmms15)
     except Exception as e:
-        logger.error(f"Unexpected error parsing row: {e}, row data: {row}")
+        logger.error(f"Unexpected error parsing row: {e}, row data: {values}")
         return None
 
 
@@ -283,47 +456,117 @@ def stream_and_ingest():
         last_db_date = get_latest_date_from_db(conn)
         logger.info(f"Latest date in DB: {last_db_date if last_db_date else 'None (Empty DB)'}")
 
-        new_records = []
+        # New records accumulate as three parallel column lists rather than a
+        # list of per-row containers: a full-history reload holds thousands of
+        # records, and the columnar layout avoids a dict/tuple allocation plus
+        # pointer overhead per row
+        new_dates = []
+        new_pmms30s = []
+        new_pmms15s = []
         processed_rows = 0
         skipped_rows = 0
+        PARSE_REJECT_COUNTS.clear()
         
         # 1. STREAM: Open connection with stream=True
         logger.info(f"Initiating HTTP request to: {CSV_URL}")
-        proxies = get_proxies()
-        auth = get_auth()
-        
+        session = get_session()
+
+        # Conditional GET: if the CSV is unchanged since the last successful
+        # run the server answers 304 and the whole parse+DB path is skipped.
+        # An empty table always forces a full fetch - a leftover sidecar from
+        # a deleted database must not 304 away the rebuild.
+        request_headers = {} if last_db_date is None else load_cached_validators()
+
         try:
-            with requests.get(CSV_URL, stream=True, timeout=CONFIG['REQUEST_TIMEOUT'], 
-                          proxies=proxies, auth=auth) as r:
+            with session.get(CSV_URL, stream=True, timeout=CONFIG['REQUEST_TIMEOUT'],
+                          headers=request_headers) as r:
+                if r.status_code == 304:
+                    logger.info("CSV unchanged since last run (HTTP 304) - nothing to do")
+                    return
                 r.raise_for_status()
+                response_headers = r.headers
                 logger.info(f"HTTP request successful, status code: {r.status_code}")
                 logger.info(f"Content type: {r.headers.get('content-type', 'Unknown')}")
                 logger.info(f"Content length: {r.headers.get('content-length', 'Unknown')}")
-                
-                # Create a generator that decodes lines on the fly
-                lines = (line.decode('utf-8') for line in r.iter_lines())
-                
+
+                # Let csv consume the response stream directly: urllib3
+                # transparently inflates the gzip transfer encoding and
+                # TextIOWrapper does buffered UTF-8 decoding in C, instead of
+                # iter_lines' per-line Python-level decode
+                r.raw.decode_content = True
+                lines = io.TextIOWrapper(r.raw, encoding='utf-8', newline='')
+
                 try:
-                    # Use csv.DictReader on the generator
-                    reader = csv.DictReader(lines)
-                    logger.info(f"CSV headers detected: {reader.fieldnames}")
-                    
-                    for row in reader:
+                    # Use csv.reader with positional indices; DictReader's
+                    # per-row dict construction roughly doubles parse cost
+                    reader = csv.reader(lines)
+                    # Normalize the header exactly once (per-row key
+                    # lowercasing was removed with the switch to csv.reader);
+                    # a leading UTF-8 BOM would otherwise break the 'date'
+                    # column lookup
+                    header = [h.lstrip('\ufeff').strip().lower()
+                              for h in next(reader, [])]
+                    logger.info(f"CSV headers detected: {header}")
+
+                    def find_column(*names):
+                        for name in names:
+                            if name in header:
+                                return header.index(name)
+                        return None
+
+                    date_i = find_column('date')
+                    pmms30_i = find_column('pmms30', '30-yr frm')
+                    pmms15_i = find_column('pmms15', '15-yr frm')
+                    if date_i is None:
+                        logger.warning(f"No 'date' column found in header: {header}")
+
+                    # Hoist per-iteration lookups out of the hot loop: the
+                    # progress check becomes a local countdown instead of a
+                    # CONFIG dict read plus modulo per row
+                    progress_interval = CONFIG['PROGRESS_LOG_INTERVAL']
+                    rows_until_log = progress_interval
+                    _parse_row = parse_row
+                    _append_date = new_dates.append
+                    _append_pmms30 = new_pmms30s.append
+                    _append_pmms15 = new_pmms15s.append
+
+                    for values in reader:
                         processed_rows += 1
-                        clean_data = parse_row(row)
-                        
+
+                        # Log progress every N rows
+                        rows_until_log -= 1
+                        if not rows_until_log:
+                            rows_until_log = progress_interval
+                            logger.info(f"Processed {processed_rows} rows, found {len(new_dates)} new records, skipped {skipped_rows} rows")
+
+                        # 2. FILTER: Cheaply reject rows we already have before
+                        # paying for datetime parsing and float conversion.
+                        # Incremental runs discard ~99% of rows here.
+                        if last_db_date is not None and date_i is not None and date_i < len(values):
+                            raw_date = values[date_i].strip()
+                            if len(raw_date) == 10 and raw_date[4] == '-':
+                                # Already ISO YYYY-MM-DD: sortable as-is
+                                if raw_date <= last_db_date:
+                                    continue
+                            elif '/' in raw_date:
+                                # M/D/YYYY: year-only comparison is enough to
+                                # reject anything from strictly older years
+                                year = raw_date.rsplit('/', 1)[-1]
+                                if len(year) == 4 and year < last_db_date[:4]:
+                                    continue
+
+                        clean_data = _parse_row(values, date_i, pmms30_i, pmms15_i)
+
                         if not clean_data:
                             skipped_rows += 1
                             continue
 
-                        # 2. FILTER: Only keep records newer than what we have
-                        if last_db_date is None or clean_data['date'] > last_db_date:
-                            new_records.append(clean_data)
-                            
-                        # Log progress every N rows
-                        if processed_rows % CONFIG['PROGRESS_LOG_INTERVAL'] == 0:
-                            logger.info(f"Processed {processed_rows} rows, found {len(new_records)} new records, skipped {skipped_rows} rows")
-                            
+                        row_date = clean_data[0]
+                        if last_db_date is None or row_date > last_db_date:
+                            _append_date(row_date)
+                            _append_pmms30(clean_data[1])
+                            _append_pmms15(clean_data[2])
+
                 except csv.Error as e:
                     logger.error(f"CSV parsing error: {e}")
                     raise
@@ -344,22 +587,45 @@ def stream_and_ingest():
             logger.error(f"Request failed: {e}")
             raise
 
-        logger.info(f"Streaming completed. Processed {processed_rows} total rows, skipped {skipped_rows} invalid rows, found {len(new_records)} new records")
+        logger.info(f"Streaming completed. Processed {processed_rows} total rows, skipped {skipped_rows} invalid rows, found {len(new_dates)} new records")
+        if PARSE_REJECT_COUNTS:
+            details = ', '.join(f"{reason}={count}" for reason, count in sorted(PARSE_REJECT_COUNTS.items()))
+            logger.warning(f"Rejected values during parsing: {details}")
 
         # 3. LOAD: Insert only new records
-        if new_records:
-            logger.info(f"Inserting {len(new_records)} new records into database")
+        if new_dates:
+            logger.info(f"Inserting {len(new_dates)} new records into database")
             
             try:
-                # Update SQLite
+                # Update SQLite inside a single explicit transaction so every
+                # insert shares one fsync, regardless of the driver's
+                # isolation_level setting
                 cursor = conn.cursor()
-                for record in new_records:
+                cursor.execute("BEGIN IMMEDIATE")
+                if last_db_date is None:
+                    # Full load into an empty table: stage rows without an
+                    # index, then copy them over in date order so the PRIMARY
+                    # KEY B-tree is built from sorted input in one pass
+                    # instead of being rebalanced row by row. temp_store is
+                    # MEMORY, so staging never touches disk.
+                    logger.info("Empty database detected - bulk loading via staging table")
+                    cursor.execute("CREATE TEMP TABLE staging (date TEXT, pmms30 REAL, pmms15 REAL)")
+                    insert_records(cursor, new_dates, new_pmms30s, new_pmms15s,
+                                   sql_prefix=STAGING_SQL_PREFIX, sql_suffix='')
+                    changes_before = conn.total_changes
                     cursor.execute(f'''
                         INSERT OR IGNORE INTO {TABLE_NAME} (date, pmms30, pmms15)
-                        VALUES (?, ?, ?)
-                    ''', (record['date'], record['pmms30'], record['pmms15']))
+                        SELECT date, pmms30, pmms15 FROM staging ORDER BY date
+                    ''')
+                    cursor.execute("DROP TABLE staging")
+                else:
+                    changes_before = conn.total_changes
+                    insert_records(cursor, new_dates, new_pmms30s, new_pmms15s)
                 conn.commit()
-                logger.info("Successfully committed new records to SQLite DB")
+                # total_changes excludes rows swallowed by DO NOTHING, so the
+                # delta is the true inserted count without any readback query
+                inserted_rows = conn.total_changes - changes_before
+                logger.info(f"Successfully committed {inserted_rows} new records to SQLite DB")
             except sqlite3.Error as e:
                 logger.error(f"Database insert failed: {e}")
                 conn.rollback()
@@ -367,6 +633,9 @@ def stream_and_ingest():
         else:
             logger.info("No new data found. Local storage is up to date")
 
+        # Remember the validators only once the whole run has succeeded
+        save_cached_validators(response_headers)
+
     except Exception as e:
         logger.error(f"Fatal error in streaming ingestion: {e}")
         raise